@@ -1,17 +1,37 @@
 from pathlib import Path
+import os
 import io
+import re
+import csv
 import zipfile as zf
-import json
-from typing import IO, List, Dict, Any, Union, Optional
-import warnings
+from typing import IO, List, Dict, Any, Union, Optional, Literal, Callable, Iterable, FrozenSet
 import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # non-standard library imports
+try:
+    # orjson parses the (possibly multiple megabyte) state files considerably faster
+    import orjson as _json
+except ImportError:
+    import json as _json
 import yaml
+try:
+    # the libyaml based loader is a lot faster than the pure Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+import numpy as np
 import pandas as pd
 import bifrost_common_py.selectors as select
 from bifrost_common_py.safepointer import safepointer
 
+# ids contain colons, which are replaced by underscores in file and folder names (to be valid on Windows)
+_ID_TRANSLATION = str.maketrans(':', '_')
+
+# matches the column names of array dynamics, which end with the index of the value
+_INDEX_COLUMN_PATTERN = re.compile(r".*_(?P<idx>\d+)")
+
 class BsxException(Exception):
     pass
 
@@ -49,6 +69,100 @@ class DynamicTimseriesParsingError(BsxException):
         self.dynamic_id = dynamic_id
         super().__init__(f"Dynamic timeseries for dynamic {dynamic_id} could not be parsed from run {run_id}")
 
+def _parse_timeseries_header(data: bytes) -> List[str]:
+    '''
+    Parses the column names from the header line of the CSV of a dynamic timeseries.
+    
+    Raises
+    ------
+    pandas.errors.EmptyDataError
+        If the CSV does not even contain a header.
+    '''
+    header_end = data.find(b'\n')
+    if header_end == -1:
+        header_end = len(data)
+    
+    header = next(csv.reader([data[:header_end].decode()]), [])
+    if len(header) == 0:
+        raise pd.errors.EmptyDataError('No columns to parse from file')
+    
+    return header
+
+def _parse_timeseries_csv(data: bytes, header: List[str], usecols: Optional[List[int]]=None) -> pd.DataFrame:
+    '''
+    Parses the CSV of a dynamic timeseries, read completely into memory.
+    Only the columns at the positions in `usecols` are parsed, or all when it is `None`.
+    
+    The values are parsed with numpy directly, as they are usually purely numeric.
+    Value columns holding only whole numbers are int64, other numeric columns float64.
+    If numpy cannot parse the values (e.g. missing or non-numeric values), pandas is
+    used instead and infers the types of the value columns.
+    The timestep column is always int64.
+    '''
+    columns = header if usecols is None else [ header[i] for i in usecols ]
+    
+    header_end = data.find(b'\n')
+    
+    # only parse with numpy if there are any rows at all, numpy warns about empty input
+    if header_end != -1 and not data[header_end:].isspace():
+        try:
+            values = np.loadtxt(io.BytesIO(data), delimiter=',', skiprows=1, dtype=np.float64, ndmin=2, usecols=usecols)
+        except ValueError:
+            # not purely numeric or with missing values, let pandas handle it
+            pass
+        else:
+            if values.shape[1] == len(columns):
+                df_columns = { columns[0]: values[:, 0].astype(np.int64) }
+                for i, name in enumerate(columns[1:], start=1):
+                    df_columns[name] = _whole_numbers_as_int(values[:, i])
+                return pd.DataFrame(df_columns)
+    
+    # numeric values were handled above, so only the type of the timestep column is known here
+    # the whole member is in memory already, so let pandas infer the types in one pass over it
+    return pd.read_csv(io.BytesIO(data), header=0, usecols=usecols, dtype={ header[0]: 'int64' }, engine='c', low_memory=False)
+
+def _whole_numbers_as_int(values: np.ndarray) -> np.ndarray:
+    # like pandas would infer for integer values, as long as the floats hold them exactly
+    # (this also rules out nan and inf, which cannot be cast)
+    if not np.all(np.abs(values) <= 2**53):
+        return values
+    
+    # casting and comparing is a lot faster than checking the fractional part with np.mod
+    integer_values = values.astype(np.int64)
+    if np.array_equal(integer_values, values):
+        return integer_values
+    
+    return values
+
+def _parse_timeseries_csv_polars(data: bytes, header: List[str], usecols: Optional[List[int]]=None) -> pd.DataFrame:
+    '''
+    Parses the CSV of a dynamic timeseries with the multithreaded polars CSV reader
+    and converts the result to a pandas DataFrame backed by pyarrow arrays.
+    Only the columns at the positions in `usecols` are parsed, or all when it is `None`.
+    
+    Raises
+    ------
+    ImportError
+        If polars is not installed.
+    pandas.errors.ParserError
+        If polars could not read the CSV.
+    '''
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError("The polars backend requires the polars and pyarrow packages to be installed") from e
+    
+    try:
+        # infer the types from all rows, not just the first 100, like pandas does
+        df = pl.read_csv(data, columns=usecols, infer_schema_length=None)
+    except pl.exceptions.PolarsError as e:
+        raise pd.errors.ParserError(f'polars could not read the CSV: {e}') from e
+    
+    return df.to_pandas(use_pyarrow_extension_array=True)
+
+# signature of the CSV parsers above
+_TimeseriesParser = Callable[[bytes, List[str], Optional[List[int]]], pd.DataFrame]
+
 class BsxArchive:
     '''
     A Bifrost Super Import/Export (BSX) ZIP archive.
@@ -56,6 +170,11 @@ class BsxArchive:
     This class is a wrapper around a zipfile.ZipFile object that provides
     some convenience methods for extracting and parsing the contents of
     a Bifrost Super Import/Export ZIP archive.
+    
+    When opened from a path, the archive file stays open and is shared by all reads
+    of archive members until `close` is called, or the `with` block is left
+    when used as a context manager. A passed in zipfile.ZipFile is left open,
+    closing it is up to the caller.
     '''
     def __init__(self, bsx_archive: Union[str, zf.ZipFile, bytes]):
         if isinstance(bsx_archive, str):
@@ -67,11 +186,61 @@ class BsxArchive:
         else:
             raise TypeError(f'bsx_archive must be a string, zipfile.ZipFile or bytes, but is {type(bsx_archive)}')
         
-        self._state_at_export = self.get_state()
+        # only close the ZipFile on close when it was opened here
+        self._owns_bsx_archive = not isinstance(bsx_archive, zf.ZipFile)
+        
+        # the path or bytes the ZipFile was opened from, to open further ZipFiles for worker threads
+        self._bsx_archive_source = bsx_archive if self._owns_bsx_archive else None
+        
+        # [:-1] to remove trailing slash
+        self._run_directories = frozenset(info.filename[:-1] for info in self.bsx_archive.infolist() if info.is_dir() and info.filename.startswith('RUN'))
+        
+        # parsed contents of the archive, cached per instance and dropped on close
+        self._state_cache: Dict[Optional[str], Dict[str, Any]] = {}
+        self._dynamics_metadata_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
+    @functools.cached_property
+    def _state_at_export(self) -> Dict[str, Any]:
+        # loaded on first access, callers reading only timeseries never need to parse the state
+        return self.get_state()
+    
+    @functools.cached_property
+    def _directory_fragment(self) -> Dict[str, Any]:
+        directory_fragment_file = 'directory_fragment.yaml'
+        
+        return yaml.load(self.bsx_archive.read(directory_fragment_file), Loader=_YamlLoader)
+        
+    def close(self):
+        '''
+        Closes the underlying ZIP archive and drops the cached contents of the archive.
+        
+        A zipfile.ZipFile passed to the constructor is not closed.
+        '''
+        if self._owns_bsx_archive:
+            self.bsx_archive.close()
+        
+        self._state_cache.clear()
+        self._dynamics_metadata_cache.clear()
+        
+        # drop the values of the cached properties, they are loaded again on next access
+        self.__dict__.pop('_state_at_export', None)
+        self.__dict__.pop('_directory_fragment', None)
+        
+    def __enter__(self) -> 'BsxArchive':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        
+    def _open_bsx_archive_source(self) -> zf.ZipFile:
+        if isinstance(self._bsx_archive_source, str):
+            return zf.ZipFile(self._bsx_archive_source)
+        
+        return zf.ZipFile(io.BytesIO(self._bsx_archive_source))
         
     @staticmethod
     def _id_to_filesystem_name(id: str) -> str:
-        return id.replace(':', '_')
+        return id.translate(_ID_TRANSLATION)
         
     def get_settlement_id(self) -> str:
         '''
@@ -101,12 +270,15 @@ class BsxArchive:
             the state of the settlement when the BSX archive was created.
         '''
         
-        state_file = 'state.json'
-        
-        if run_id is not None:
-            state_file = f'{self._id_to_filesystem_name(run_id)}/{state_file}'
+        if run_id not in self._state_cache:
+            state_file = 'state.json'
+            
+            if run_id is not None:
+                state_file = f'{self._id_to_filesystem_name(run_id)}/{state_file}'
+            
+            self._state_cache[run_id] = _json.loads(self.bsx_archive.read(state_file))
         
-        return json.loads(self.bsx_archive.read(state_file))
+        return self._state_cache[run_id]
     
     def get_directory_fragment(self) -> Dict[str, Any]:
         '''
@@ -118,9 +290,7 @@ class BsxArchive:
             The directory fragment object.
         '''
         
-        directory_fragment_file = 'directory_fragment.yaml'
-        
-        return yaml.safe_load(self.bsx_archive.read(directory_fragment_file))
+        return self._directory_fragment
     
     def get_runs_metadata(self, named_runs_only:bool=False) -> Dict[str, Dict[str, Any]]:
         '''
@@ -145,7 +315,6 @@ class BsxArchive:
             
         return runs_metadata
     
-    @functools.lru_cache
     def get_dynamics_metadata(self, run_id: str) -> Dict[str, Dict[str, Any]]:
         '''
         Returns the metadata for all dynamics in the specified run, keyed by dynamic id.
@@ -161,31 +330,30 @@ class BsxArchive:
             The metadata for all dynamics in the specified run, keyed by dynamic id.
         '''
         
+        if run_id in self._dynamics_metadata_cache:
+            return self._dynamics_metadata_cache[run_id]
+        
         # the folder name in the archive is the run id with colons replaced by underscores (to be a valid folder name on Windows)
         run_directory_name = self._id_to_filesystem_name(run_id)
         
-        # [:-1] to remove trailing slash
-        run_directories = [ p.filename[:-1] for p in self.bsx_archive.infolist() if p.is_dir() and p.filename.startswith('RUN') ]
-        
-        directory_matches = [ d for d in run_directories if d == run_directory_name ]
-        if len(directory_matches) == 0:
-            return []
-        elif len(directory_matches) > 1:
-            warnings.warn(f"Multiple run directories with name {run_directory_name} found in BSX archive, using first match.")
+        if run_directory_name not in self._run_directories:
+            return {}
         
-        run_directory = directory_matches[0]
+        dynamics_metadata_file = f'{run_directory_name}/dynamics_metadata.json'
         
-        dynamics_metadata_file = f'{run_directory}/dynamics_metadata.json'
+        dynamics_metadata = _json.loads(self.bsx_archive.read(dynamics_metadata_file))
         
-        dynamics_metadata = json.loads(self.bsx_archive.read(dynamics_metadata_file))
+        # the file contains a list of dynamics, key them by id for lookups
+        self._dynamics_metadata_cache[run_id] = { dynamic['id']: dynamic for dynamic in dynamics_metadata }
         
-        return dynamics_metadata
+        return self._dynamics_metadata_cache[run_id]
     
-    @functools.lru_cache
     def dynamic_timeseries_exists(self, run_id: str, dynamic_id: str) -> bool:
         '''
         Returns `True` if the specified dynamic exists in the specified run, `False` otherwise.
         
+        A dynamic exists, if there is a timeseries file for it in the run directory.
+        
         Parameters
         ----------
         run_id : str
@@ -198,31 +366,95 @@ class BsxArchive:
         bool
             `True` if the specified dynamic exists in the specified run, `False` otherwise.
         '''
-        dynamics_metadata = self.get_dynamics_metadata(run_id)
+        # the timeseries file in the archive is authoritative, the dynamics metadata is not needed
+        timeseries_path = self._timeseries_path(run_id, dynamic_id)
         
-        if dynamic_id not in [ dynamic['id'] for dynamic in dynamics_metadata ]:
+        try:
+            if self.bsx_archive.getinfo(timeseries_path).is_dir():
+                return False
+        except KeyError:
             return False
         
+        return True
+    
+    def _timeseries_path(self, run_id: str, dynamic_id: str) -> str:
         run_directory = self._id_to_filesystem_name(run_id)
         dynamic_id_file = self._id_to_filesystem_name(dynamic_id)
         
-        timeseries_path = f'{run_directory}/dynamics_timeseries/{dynamic_id_file}.csv'
+        return f'{run_directory}/dynamics_timeseries/{dynamic_id_file}.csv'
+    
+    @staticmethod
+    def _get_timeseries_parser(backend: str) -> _TimeseriesParser:
+        if backend == 'pandas':
+            return _parse_timeseries_csv
+        elif backend == 'polars':
+            return _parse_timeseries_csv_polars
+        else:
+            raise ValueError(f"backend must be 'pandas' or 'polars', but is {backend!r}")
+    
+    @staticmethod
+    def _selected_column_names(columns: Optional[Iterable[int]]) -> Optional[FrozenSet[str]]:
+        # the column names are the indices as strings, collected once so any iterable can be passed
+        return None if columns is None else frozenset(str(idx) for idx in columns)
+    
+    def _read_dynamic_timeseries(self, timeseries_info: zf.ZipInfo, run_id: str, dynamic_id: str, parse_timeseries_csv: _TimeseriesParser, selected_names: Optional[FrozenSet[str]]=None) -> pd.DataFrame:
+        # passing the ZipInfo instead of the name skips the lookup in the central directory
+        data = self.bsx_archive.read(timeseries_info)
         
+        return self._parse_dynamic_timeseries(data, run_id, dynamic_id, parse_timeseries_csv, selected_names)
+    
+    @staticmethod
+    def _parse_dynamic_timeseries(data: bytes, run_id: str, dynamic_id: str, parse_timeseries_csv: _TimeseriesParser, selected_names: Optional[FrozenSet[str]]=None) -> pd.DataFrame:
         try:
-            if self.bsx_archive.getinfo(timeseries_path).is_dir():
-                return False
-        except KeyError:
-            return False
+            header = _parse_timeseries_header(data)
+            
+            # if there are more than two columns, then the dynamic is an array
+            # decided on the header, so it does not change when only some columns are selected
+            if len(header) > 2:
+                # rename the columns to keep only the index in the name
+                column_names = ['Timestep'] + [ _INDEX_COLUMN_PATTERN.sub(r'\g<idx>', c) for c in header[1:] ]
+            else:
+                column_names = ['Timestep'] + ['0'] * (len(header) - 1)
+            
+            usecols = None
+            if selected_names is not None:
+                # only parse the selected columns, but always the timestep, it is needed for the time index
+                usecols = [0] + [ i for i in range(1, len(header)) if column_names[i] in selected_names ]
+            
+            df = parse_timeseries_csv(data, header, usecols)
+            
+            df.columns = column_names if usecols is None else [ column_names[i] for i in usecols ]
+            
+            # the timesteps are seconds since the epoch, so the time index is a plain cast of them
+            df.index = pd.DatetimeIndex(df['Timestep'].to_numpy().astype('datetime64[s]'), name='Time')
+            
+            # sort the columns by their index
+            # but the columns are strings so we need to convert to int first
+            # but some columns are not integers, so we need to handle that
+            column_index = np.array(df.columns, dtype=object)
+            
+            # first, check once which columns are integers
+            integer_mask = np.array([ c.isdigit() for c in column_index ], dtype=bool)
+            
+            # then, sort the integer columns by their value, keeping the order of equal indices
+            integer_columns = column_index[integer_mask]
+            integer_order = np.argsort(integer_columns.astype(np.int64), kind='stable')
+            
+            # then, put the columns back together, non-integer columns first
+            df = df[list(column_index[~integer_mask]) + list(integer_columns[integer_order])]
+            
+            return df
         
-        return True
+        except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+            raise DynamicTimseriesParsingError(run_id, dynamic_id) from e
     
-    def get_dynamic_timeseries(self, run_id: str, dynamic_id: str) -> pd.DataFrame:
+    def get_dynamic_timeseries(self, run_id: str, dynamic_id: str, backend: Literal['pandas', 'polars']='pandas', columns: Optional[Iterable[int]]=None) -> pd.DataFrame:
         '''
         Returns a pandas DataFrame containing the timeseries data for the specified dynamic.
         
         Columns
         -------
-        - `Time` (datetime, index): The time of the data point in the simulation in seconds UTC
+        - `Time` (datetime64[s], index): The time of the data point in the simulation, UTC with second resolution
         - `Timestep` (int): The timestep of the data point in the simulation
         - `[0-9]+` (unknown):  The value of the dynamic, in one to multiple columns, if the dynamic is an array
         
@@ -232,63 +464,168 @@ class BsxArchive:
             The id of the run to get the dynamic timeseries from
         dynamic_id : str
             The id of the dynamic to get the timeseries for
+        backend : Literal['pandas', 'polars'], optional
+            The CSV parser to use, by default 'pandas'. The 'polars' backend parses
+            with multiple threads and requires polars and pyarrow to be installed.
+        columns : Optional[Iterable[int]], optional
+            The indices of the values to parse, by default None to parse all of them.
+            For a dynamic that is not an array, the value has the index 0.
+            The `Timestep` column is always included.
             
         Raises
         ------
+        ValueError
+            If `backend` is not one of 'pandas' or 'polars'.
         DynamicTimeseriesNotFoundError
             If the specified dynamic does not exist in the specified run.
         DynamicTimeseriesParsingError
             If the timeseries file for the specified dynamic could not be parsed.
         '''
-        run_directory = self._id_to_filesystem_name(run_id)
-        dynamic_id_file = self._id_to_filesystem_name(dynamic_id)
+        parse_timeseries_csv = self._get_timeseries_parser(backend)
+        selected_names = self._selected_column_names(columns)
+        
+        try:
+            timeseries_info = self.bsx_archive.getinfo(self._timeseries_path(run_id, dynamic_id))
+        except KeyError as e:
+            raise DynamicTimeseriesNotFoundError(run_id, dynamic_id) from e
+        
+        return self._read_dynamic_timeseries(timeseries_info, run_id, dynamic_id, parse_timeseries_csv, selected_names)
+    
+    def try_get_dynamic_timeseries(self, run_id: str, dynamic_id: str, backend: Literal['pandas', 'polars']='pandas', columns: Optional[Iterable[int]]=None) -> Optional[pd.DataFrame]:
+        '''
+        Returns a pandas DataFrame containing the timeseries data for the specified dynamic,
+        or `None` if there is no timeseries for the dynamic in the specified run.
+        
+        This is a single lookup in the archive, instead of checking with
+        `dynamic_timeseries_exists` before calling `get_dynamic_timeseries`.
+        The columns are the same as returned by `get_dynamic_timeseries`.
         
-        timeseries_path = f'{run_directory}/dynamics_timeseries/{dynamic_id_file}.csv'
+        Parameters
+        ----------
+        run_id : str
+            The id of the run to get the dynamic timeseries from
+        dynamic_id : str
+            The id of the dynamic to get the timeseries for
+        backend : Literal['pandas', 'polars'], optional
+            The CSV parser to use, by default 'pandas'. See `get_dynamic_timeseries`.
+        columns : Optional[Iterable[int]], optional
+            The indices of the values to parse, by default None to parse all of them.
+            See `get_dynamic_timeseries`.
+            
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            The timeseries data for the specified dynamic, or `None` if it does not exist.
+            
+        Raises
+        ------
+        ValueError
+            If `backend` is not one of 'pandas' or 'polars'.
+        DynamicTimeseriesParsingError
+            If the timeseries file for the specified dynamic could not be parsed.
+        '''
+        parse_timeseries_csv = self._get_timeseries_parser(backend)
+        selected_names = self._selected_column_names(columns)
         
         try:
+            timeseries_info = self.bsx_archive.getinfo(self._timeseries_path(run_id, dynamic_id))
+        except KeyError:
+            return None
+        
+        if timeseries_info.is_dir():
+            return None
+        
+        return self._read_dynamic_timeseries(timeseries_info, run_id, dynamic_id, parse_timeseries_csv, selected_names)
+    
+    def get_many_dynamic_timeseries(self, run_id: str, dynamic_ids: Iterable[str], backend: Literal['pandas', 'polars']='pandas', columns: Optional[Iterable[int]]=None, max_workers: Optional[int]=None) -> Dict[str, pd.DataFrame]:
+        '''
+        Returns pandas DataFrames containing the timeseries data for multiple dynamics
+        of the same run, keyed by dynamic id.
+        
+        With the 'pandas' backend, the timeseries are parsed in parallel by a pool of threads.
+        When the archive was opened from a path or bytes, each thread reads from its own
+        zipfile.ZipFile, so the files are also inflated in parallel. For a zipfile.ZipFile
+        passed in by the caller, the files are inflated one after another and only the
+        parsing is parallel. The 'polars' backend already parses with multiple threads,
+        so the timeseries are loaded one after another.
+        The columns are the same as returned by `get_dynamic_timeseries`.
+        
+        Parameters
+        ----------
+        run_id : str
+            The id of the run to get the dynamic timeseries from
+        dynamic_ids : Iterable[str]
+            The ids of the dynamics to get the timeseries for
+        backend : Literal['pandas', 'polars'], optional
+            The CSV parser to use, by default 'pandas'. See `get_dynamic_timeseries`.
+        columns : Optional[Iterable[int]], optional
+            The indices of the values to parse, by default None to parse all of them.
+            See `get_dynamic_timeseries`.
+        max_workers : Optional[int], optional
+            The number of threads loading the timeseries with the 'pandas' backend,
+            by default the number of CPUs
             
-            with self.bsx_archive.open(timeseries_path) as f:
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            The timeseries data for each of the specified dynamics, keyed by dynamic id.
             
-                try:
-                    df = pd.read_csv(f, header=0)
-                    
-                    # rename the timestep column
-                    df.rename(columns={'SimulationTime[s]': 'Timestep'}, inplace=True)
-                    
-                    # if there are more than two columns, then the dynamic is an array
-                    if len(df.columns) > 2:
-                        # rename the columns to keep only the index in the name
-                        pattern = r".*_(?P<idx>\d+)"
-                        replace = lambda m: m.group('idx')
-                        
-                        # replace the column names with the index
-                        df.columns = df.columns.str.replace(pattern, replace, regex=True)
-                    else:
-                        df.columns = ['Timestep', '0']
-                        
-                    df['Time'] = pd.to_datetime(df['Timestep'], unit='s')
-                    df.set_index('Time', inplace=True)
-                    
-                    # sort the columns by their index
-                    # but the columns are strings so we need to convert to int first
-                    # but some columns are not integers, so we need to handle that
-                    
-                    # first, get the columns that are not integers
-                    non_integer_columns = [ c for c in df.columns if not c.isdigit() ]
-                    
-                    # then, get the columns that are integers
-                    integer_columns = [ c for c in df.columns if c.isdigit() ]
-                    
-                    # then, sort the integer columns
-                    integer_columns = sorted(integer_columns, key=lambda c: int(c))
-                    
-                    # then, put the columns back together
-                    df = df[non_integer_columns + integer_columns]
-                    
-                    return df
-                
-                except pd.errors.EmptyDataError as e:
-                    raise DynamicTimseriesParsingError(run_id, dynamic_id) from e
+        Raises
+        ------
+        ValueError
+            If `backend` is not one of 'pandas' or 'polars'.
+        DynamicTimeseriesNotFoundError
+            If one of the specified dynamics does not exist in the specified run.
+        DynamicTimeseriesParsingError
+            If the timeseries file for one of the specified dynamics could not be parsed.
+        '''
+        parse_timeseries_csv = self._get_timeseries_parser(backend)
+        selected_names = self._selected_column_names(columns)
+        
+        # look up all files first, so a missing timeseries fails before anything is read
+        timeseries_infos = {}
+        for dynamic_id in dynamic_ids:
+            try:
+                timeseries_infos[dynamic_id] = self.bsx_archive.getinfo(self._timeseries_path(run_id, dynamic_id))
+            except KeyError as e:
+                raise DynamicTimeseriesNotFoundError(run_id, dynamic_id) from e
+        
+        if backend == 'polars':
+            # polars has its own thread pool, more threads would only oversubscribe the CPUs
+            return {
+                dynamic_id: self._read_dynamic_timeseries(timeseries_info, run_id, dynamic_id, parse_timeseries_csv, selected_names)
+                for dynamic_id, timeseries_info in timeseries_infos.items()
+            }
+        
+        # zipfile.ZipFile is not safe to read from multiple threads, so each worker opens its own
+        worker_archives = threading.local()
+        opened_archives: List[zf.ZipFile] = []
+        
+        def read_dynamic_timeseries(timeseries_info: zf.ZipInfo, dynamic_id: str) -> pd.DataFrame:
+            bsx_archive = getattr(worker_archives, 'bsx_archive', None)
+            if bsx_archive is None:
+                bsx_archive = worker_archives.bsx_archive = self._open_bsx_archive_source()
+                opened_archives.append(bsx_archive)
+            
+            # the ZipInfo of the same archive can be read from any ZipFile opened on it
+            return self._parse_dynamic_timeseries(bsx_archive.read(timeseries_info), run_id, dynamic_id, parse_timeseries_csv, selected_names)
         
-        except KeyError as e:
-            raise DynamicTimeseriesNotFoundError(run_id, dynamic_id) from e
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                if self._bsx_archive_source is None:
+                    # a ZipFile passed in by the caller cannot be opened again,
+                    # so it is only read from this thread, the workers only get the inflated bytes
+                    futures = {
+                        dynamic_id: executor.submit(self._parse_dynamic_timeseries, self.bsx_archive.read(timeseries_info), run_id, dynamic_id, parse_timeseries_csv, selected_names)
+                        for dynamic_id, timeseries_info in timeseries_infos.items()
+                    }
+                else:
+                    futures = {
+                        dynamic_id: executor.submit(read_dynamic_timeseries, timeseries_info, dynamic_id)
+                        for dynamic_id, timeseries_info in timeseries_infos.items()
+                    }
+                
+                return { dynamic_id: future.result() for dynamic_id, future in futures.items() }
+        finally:
+            for bsx_archive in opened_archives:
+                bsx_archive.close()